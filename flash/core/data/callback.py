@@ -1,5 +1,6 @@
 from contextlib import contextmanager
-from typing import Any, List, Sequence
+from operator import attrgetter
+from typing import Any, Callable, List, Sequence
 
 from pytorch_lightning.callbacks import Callback
 from pytorch_lightning.trainer.states import RunningStage
@@ -46,9 +47,52 @@ class FlashCallback(Callback):
         """Called once ``per_batch_transform_on_device`` has been applied to a sample."""
 
 
+# the position of each hook is its id, ``ControlFlow`` hard-codes these ids in its hooks
+_HOOK_NAMES = (
+    "on_load_sample",
+    "on_pre_tensor_transform",
+    "on_to_tensor_transform",
+    "on_post_tensor_transform",
+    "on_per_batch_transform",
+    "on_collate",
+    "on_per_sample_transform_on_device",
+    "on_per_batch_transform_on_device",
+)
+
+# fetches all the hooks of a callback in a single C-level call
+_get_hooks = attrgetter(*_HOOK_NAMES)
+
+
+def _noop(*args, **kwargs) -> None:
+    pass
+
+
+def _is_overridden(hook: Callable, name: str) -> bool:
+    return getattr(hook, "__func__", None) is not getattr(FlashCallback, name)
+
+
 class ControlFlow(FlashCallback):
+    """The ``ControlFlow`` dispatches the :class:`~flash.core.data.process.Preprocess` hooks to a list of
+    :class:`FlashCallback`.
+
+    Args:
+        callbacks: The callbacks to run. The list is shared with the caller, the hooks are resolved again whenever
+            the number of callbacks in it changes.
+    """
+
     def __init__(self, callbacks: List[FlashCallback]):
         self._callbacks = callbacks
+        self._resolve()
+
+    def _resolve(self) -> None:
+        # resolve the bound hooks once instead of on every sample, skipping the ``FlashCallback`` no-ops
+        hooks_per_callback = [_get_hooks(cb) for cb in self._callbacks]
+        # ordered like ``_HOOK_NAMES`` so each hook reads its list with a constant integer index
+        self._dispatch: List[List[Callable]] = [
+            [hooks[idx] for hooks in hooks_per_callback if _is_overridden(hooks[idx], name)]
+            for idx, name in enumerate(_HOOK_NAMES)
+        ]
+        self._num_callbacks = len(self._callbacks)
 
     def run_for_all_callbacks(self, *args, method_name: str, **kwargs):
         if self._callbacks:
@@ -56,28 +100,52 @@ class ControlFlow(FlashCallback):
                 getattr(cb, method_name)(*args, **kwargs)
 
     def on_load_sample(self, sample: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(sample, running_stage, method_name="on_load_sample")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[0]:
+            hook(sample, running_stage)
 
     def on_pre_tensor_transform(self, sample: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(sample, running_stage, method_name="on_pre_tensor_transform")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[1]:
+            hook(sample, running_stage)
 
     def on_to_tensor_transform(self, sample: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(sample, running_stage, method_name="on_to_tensor_transform")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[2]:
+            hook(sample, running_stage)
 
     def on_post_tensor_transform(self, sample: Tensor, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(sample, running_stage, method_name="on_post_tensor_transform")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[3]:
+            hook(sample, running_stage)
 
     def on_per_batch_transform(self, batch: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(batch, running_stage, method_name="on_per_batch_transform")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[4]:
+            hook(batch, running_stage)
 
     def on_collate(self, batch: Sequence, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(batch, running_stage, method_name="on_collate")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[5]:
+            hook(batch, running_stage)
 
     def on_per_sample_transform_on_device(self, sample: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(sample, running_stage, method_name="on_per_sample_transform_on_device")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[6]:
+            hook(sample, running_stage)
 
     def on_per_batch_transform_on_device(self, batch: Any, running_stage: RunningStage) -> None:
-        self.run_for_all_callbacks(batch, running_stage, method_name="on_per_batch_transform_on_device")
+        if len(self._callbacks) != self._num_callbacks:
+            self._resolve()
+        for hook in self._dispatch[7]:
+            hook(batch, running_stage)
 
 
 class BaseDataFetcher(FlashCallback):
@@ -170,11 +238,21 @@ class BaseDataFetcher(FlashCallback):
         self._preprocess = None
         self.reset()
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        # swap ``_store`` for a no-op while disabled instead of checking ``enabled`` for every sample
+        if enabled:
+            self.__dict__.pop("_store", None)
+        else:
+            self._store = _noop
+
     def _store(self, data: Any, fn_name: str, running_stage: RunningStage) -> None:
-        if self.enabled:
-            store = self.batches[_STAGES_PREFIX[running_stage]]
-            store.setdefault(fn_name, [])
-            store[fn_name].append(data)
+        self.batches[_STAGES_PREFIX[running_stage]].setdefault(fn_name, []).append(data)
 
     def on_load_sample(self, sample: Any, running_stage: RunningStage) -> None:
         self._store(sample, "load_sample", running_stage)
@@ -53,6 +53,13 @@ class IceVisionAdapter(Adapter):
         self.icevision_adapter = icevision_adapter
         self.backbone = backbone
 
+        self._dls = {
+            "train": model_type.train_dl,
+            "val": model_type.valid_dl,
+            "test": model_type.valid_dl,
+            "predict": model_type.infer_dl,
+        }
+
     @classmethod
     @catch_url_error
     def from_task(
@@ -88,18 +95,18 @@ class IceVisionAdapter(Adapter):
             DefaultDataKeys.METADATA: metadata,
         }
 
-    def process_train_dataset(
+    def _process_dataset(
         self,
+        stage: str,
         dataset: BaseAutoDataset,
         batch_size: int,
         num_workers: int,
         pin_memory: bool,
-        collate_fn: Optional[Callable] = None,
         shuffle: bool = False,
         drop_last: bool = False,
         sampler: Optional[Sampler] = None,
     ) -> DataLoader:
-        data_loader = self.model_type.train_dl(
+        data_loader = self._dls[stage](
             dataset,
             batch_size=batch_size,
             num_workers=num_workers,
@@ -111,6 +118,28 @@ class IceVisionAdapter(Adapter):
         data_loader.collate_fn = functools.partial(self._collate_fn, data_loader.collate_fn)
         return data_loader
 
+    def process_train_dataset(
+        self,
+        dataset: BaseAutoDataset,
+        batch_size: int,
+        num_workers: int,
+        pin_memory: bool,
+        collate_fn: Optional[Callable] = None,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        sampler: Optional[Sampler] = None,
+    ) -> DataLoader:
+        return self._process_dataset(
+            "train",
+            dataset,
+            batch_size,
+            num_workers,
+            pin_memory,
+            shuffle=shuffle,
+            drop_last=drop_last,
+            sampler=sampler,
+        )
+
     def process_val_dataset(
         self,
         dataset: BaseAutoDataset,
@@ -122,17 +151,16 @@ class IceVisionAdapter(Adapter):
         drop_last: bool = False,
         sampler: Optional[Sampler] = None,
     ) -> DataLoader:
-        data_loader = self.model_type.valid_dl(
+        return self._process_dataset(
+            "val",
             dataset,
-            batch_size=batch_size,
-            num_workers=num_workers,
-            pin_memory=pin_memory,
+            batch_size,
+            num_workers,
+            pin_memory,
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
         )
-        data_loader.collate_fn = functools.partial(self._collate_fn, data_loader.collate_fn)
-        return data_loader
 
     def process_test_dataset(
         self,
@@ -145,17 +173,16 @@ class IceVisionAdapter(Adapter):
         drop_last: bool = False,
         sampler: Optional[Sampler] = None,
     ) -> DataLoader:
-        data_loader = self.model_type.valid_dl(
+        return self._process_dataset(
+            "test",
             dataset,
-            batch_size=batch_size,
-            num_workers=num_workers,
-            pin_memory=pin_memory,
+            batch_size,
+            num_workers,
+            pin_memory,
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
         )
-        data_loader.collate_fn = functools.partial(self._collate_fn, data_loader.collate_fn)
-        return data_loader
 
     def process_predict_dataset(
         self,
@@ -168,17 +195,16 @@ class IceVisionAdapter(Adapter):
         drop_last: bool = True,
         sampler: Optional[Sampler] = None,
     ) -> DataLoader:
-        data_loader = self.model_type.infer_dl(
+        return self._process_dataset(
+            "predict",
             dataset,
-            batch_size=batch_size,
-            num_workers=num_workers,
-            pin_memory=pin_memory,
+            batch_size,
+            num_workers,
+            pin_memory,
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
         )
-        data_loader.collate_fn = functools.partial(self._collate_fn, data_loader.collate_fn)
-        return data_loader
 
     def training_step(self, batch, batch_idx) -> Any:
         return self.icevision_adapter.training_step(batch[DefaultDataKeys.INPUT], batch_idx)
@@ -17,6 +17,7 @@ from unittest.mock import ANY, call, MagicMock
 import torch
 from pytorch_lightning.trainer.states import RunningStage
 
+from flash.core.data.callback import ControlFlow, FlashCallback
 from flash.core.data.data_module import DataModule
 from flash.core.data.process import DefaultPreprocess
 from flash.core.model import Task
@@ -93,3 +94,107 @@ def test_flash_callback(_, __, tmpdir):
         call.on_per_batch_transform(ANY, RunningStage.VALIDATING),
         call.on_per_batch_transform_on_device(ANY, RunningStage.VALIDATING),
     ]
+
+
+def test_control_flow_partial_hooks():
+    """Test that ``ControlFlow`` handles callbacks which only implement some of the hooks."""
+
+    hook_names = [name for name in dir(FlashCallback) if name.startswith("on_") and name in vars(FlashCallback)]
+
+    control_flow = ControlFlow([])
+    for name in hook_names:
+        getattr(control_flow, name)(1, RunningStage.TRAINING)
+
+    class CustomCallback(FlashCallback):
+        def __init__(self):
+            self.samples = []
+
+        def on_load_sample(self, sample, running_stage):
+            self.samples.append(sample)
+
+    callback = CustomCallback()
+    control_flow = ControlFlow([callback, FlashCallback()])
+    for name in hook_names:
+        getattr(control_flow, name)(1, RunningStage.TRAINING)
+    assert callback.samples == [1]
+
+
+def test_control_flow_hooks():
+    """Test that each ``ControlFlow`` hook reaches the matching hook of the callbacks."""
+
+    class RecordingCallback(FlashCallback):
+        def __init__(self):
+            self.calls = []
+
+        def on_load_sample(self, sample, running_stage):
+            self.calls.append(("on_load_sample", sample, running_stage))
+
+        def on_pre_tensor_transform(self, sample, running_stage):
+            self.calls.append(("on_pre_tensor_transform", sample, running_stage))
+
+        def on_to_tensor_transform(self, sample, running_stage):
+            self.calls.append(("on_to_tensor_transform", sample, running_stage))
+
+        def on_post_tensor_transform(self, sample, running_stage):
+            self.calls.append(("on_post_tensor_transform", sample, running_stage))
+
+        def on_per_batch_transform(self, batch, running_stage):
+            self.calls.append(("on_per_batch_transform", batch, running_stage))
+
+        def on_collate(self, batch, running_stage):
+            self.calls.append(("on_collate", batch, running_stage))
+
+        def on_per_sample_transform_on_device(self, sample, running_stage):
+            self.calls.append(("on_per_sample_transform_on_device", sample, running_stage))
+
+        def on_per_batch_transform_on_device(self, batch, running_stage):
+            self.calls.append(("on_per_batch_transform_on_device", batch, running_stage))
+
+    hook_names = [
+        "on_load_sample",
+        "on_pre_tensor_transform",
+        "on_to_tensor_transform",
+        "on_post_tensor_transform",
+        "on_per_batch_transform",
+        "on_collate",
+        "on_per_sample_transform_on_device",
+        "on_per_batch_transform_on_device",
+    ]
+
+    callbacks = [RecordingCallback(), RecordingCallback()]
+    control_flow = ControlFlow(callbacks)
+    for idx, name in enumerate(hook_names):
+        getattr(control_flow, name)(idx, RunningStage.TRAINING)
+    control_flow.run_for_all_callbacks(0, RunningStage.VALIDATING, method_name="on_collate")
+
+    expected = [(name, idx, RunningStage.TRAINING) for idx, name in enumerate(hook_names)]
+    expected.append(("on_collate", 0, RunningStage.VALIDATING))
+    assert all(callback.calls == expected for callback in callbacks)
+
+    train_start = MagicMock()
+    ControlFlow([train_start]).run_for_all_callbacks(method_name="on_train_start")
+    train_start.on_train_start.assert_called_once_with()
+
+
+def test_control_flow_late_callbacks():
+    """Test that ``ControlFlow`` picks up callbacks added to the shared list after it was created."""
+
+    class CustomCallback(FlashCallback):
+        def __init__(self):
+            self.samples = []
+
+        def on_load_sample(self, sample, running_stage):
+            self.samples.append(sample)
+
+    first, second = CustomCallback(), CustomCallback()
+    callbacks = []
+    control_flow = ControlFlow(callbacks)
+    control_flow.on_load_sample(0, RunningStage.TRAINING)
+
+    callbacks.append(first)
+    control_flow.on_load_sample(1, RunningStage.TRAINING)
+    callbacks += [second]
+    control_flow.on_load_sample(2, RunningStage.TRAINING)
+
+    assert first.samples == [1, 2]
+    assert second.samples == [2]
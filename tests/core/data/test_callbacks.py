@@ -13,6 +13,7 @@
 # limitations under the License.
 from typing import Any
 
+import pytest
 import torch
 from pytorch_lightning.trainer.states import RunningStage
 from torch import tensor
@@ -79,3 +80,30 @@ def test_data_loaders_num_workers_to_0(tmpdir):
     iterator = iter(datamodule.train_dataloader())
     assert isinstance(iterator, torch.utils.data.dataloader._MultiProcessingDataLoaderIter)
     assert datamodule.num_workers == 3
+
+
+def test_base_data_fetcher_disabled():
+    data_fetcher = BaseDataFetcher()
+    data_fetcher.on_load_sample(0, RunningStage.TRAINING)
+    assert data_fetcher.batches["train"] == {}
+
+    with data_fetcher.enable():
+        data_fetcher.on_load_sample(1, RunningStage.TRAINING)
+
+    data_fetcher.on_load_sample(2, RunningStage.TRAINING)
+    assert data_fetcher.batches["train"] == {"load_sample": [1]}
+
+    with data_fetcher.enable():
+        data_fetcher.batches["train"] = {}
+        data_fetcher.on_load_sample(3, RunningStage.TRAINING)
+        assert data_fetcher.batches["train"] == {"load_sample": [3]}
+
+        data_fetcher.reset()
+        data_fetcher.on_load_sample(4, RunningStage.TRAINING)
+        assert data_fetcher.batches["train"] == {"load_sample": [4]}
+
+
+def test_base_data_fetcher_unknown_stage():
+    data_fetcher = BaseDataFetcher(enabled=True)
+    with pytest.raises(KeyError):
+        data_fetcher.on_load_sample(0, RunningStage.SANITY_CHECKING)